@@ -1,4 +1,4 @@
-from urllib.parse import urlparse
+from typing import Callable, Dict
 
 from cachetory.interfaces.backends.async_ import AsyncBackend
 
@@ -15,6 +15,20 @@ try:
 except ImportError:
     DjangoBackend = None  # type: ignore[assignment, misc]
 
+_FACTORIES: Dict[str, Callable[[str], AsyncBackend]] = {
+    "memory": MemoryBackend.from_url,
+    "dummy": DummyBackend.from_url,
+}
+"""Backend factories indexed by URL scheme."""
+
+if RedisBackend is not None:
+    _FACTORIES.update(dict.fromkeys(("redis", "rediss", "redis+unix"), RedisBackend.from_url))
+if DjangoBackend is not None:
+    _FACTORIES["django"] = DjangoBackend.from_url
+
+_EXTRAS = {"redis": "redis", "rediss": "redis", "redis+unix": "redis", "django": "django"}
+"""Package extras required by the optional backends."""
+
 
 def from_url(url: str) -> AsyncBackend:
     """
@@ -23,18 +37,11 @@ def from_url(url: str) -> AsyncBackend:
     Examples:
         >>> from_url("redis://localhost:6379")
     """
-    parsed_url = urlparse(url)
-    scheme = parsed_url.scheme
-    if scheme == "memory":
-        return MemoryBackend.from_url(url)
-    if scheme in ("redis", "rediss", "redis+unix"):
-        if RedisBackend is None:
-            raise ValueError(f"`{scheme}://` requires `cachetory[redis]` extra")  # pragma: no cover
-        return RedisBackend.from_url(url)
-    if scheme == "dummy":
-        return DummyBackend.from_url(url)
-    if scheme == "django":
-        if DjangoBackend is None:
-            raise ValueError(f"`{scheme}://` requires `cachetory[django]` extra")  # pragma: no cover
-        return DjangoBackend.from_url(url)
+    # Only the scheme is needed here, the backend parses the rest of the URL itself.
+    scheme, separator, _ = url.partition(":")
+    scheme = scheme.lower() if separator else ""
+    if (factory := _FACTORIES.get(scheme)) is not None:
+        return factory(url)
+    if (extra := _EXTRAS.get(scheme)) is not None:
+        raise ValueError(f"`{scheme}://` requires `cachetory[{extra}]` extra")  # pragma: no cover
     raise ValueError(f"`{scheme}://` is not supported")
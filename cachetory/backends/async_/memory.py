@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any, Coroutine, Generic
+from typing import AsyncIterable, Generic, Iterable
 
 from cachetory.backends.sync.memory import MemoryBackend as SyncMemoryBackend
 from cachetory.interfaces.backends.async_ import AsyncBackend
 from cachetory.interfaces.backends.private import WireT
-from cachetory.private.asyncio import postpone
 
 
 class MemoryBackend(AsyncBackend[WireT], Generic[WireT]):
@@ -18,38 +17,52 @@ class MemoryBackend(AsyncBackend[WireT], Generic[WireT]):
     def from_url(cls, _url: str) -> MemoryBackend[WireT]:
         return MemoryBackend()
 
-    def __init__(self) -> None:
-        # We'll simply delegate call to the wrapped backend.
-        self._inner: SyncMemoryBackend = SyncMemoryBackend()
+    def __init__(self, *, expiration_scan_interval: timedelta | None = None) -> None:
+        """
+        Instantiate a memory backend.
 
-    def get(self, key: str) -> Coroutine[Any, Any, WireT]:
-        return postpone(self._inner.get, key)
+        Args:
+            expiration_scan_interval: see the synchronous `MemoryBackend`.
+        """
+        # We'll simply delegate call to the wrapped backend. Plain coroutines turned out to be cheaper
+        # than returning pre-completed futures, and unlike the latter they are not bound to an event loop.
+        self._inner: SyncMemoryBackend = SyncMemoryBackend(expiration_scan_interval=expiration_scan_interval)
 
-    def expire_at(self, key: str, deadline: datetime | None) -> Coroutine[Any, Any, None]:
-        return postpone(self._inner.expire_at, key, deadline)
+    async def get(self, key: str) -> WireT:
+        return self._inner.get(key)
 
-    def set(  # noqa: A003
+    async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, WireT]]:
+        for item in self._inner.get_many(*keys):
+            yield item
+
+    async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._inner.expire_in(key, time_to_live)
+
+    async def expire_at(self, key: str, deadline: datetime | None) -> None:
+        self._inner.expire_at(key, deadline)
+
+    async def set(  # noqa: A003
         self,
         key: str,
         value: WireT,
         *,
         time_to_live: timedelta | None = None,
         if_not_exists: bool = False,
-    ) -> Coroutine[Any, Any, bool]:
-        return postpone(
-            self._inner.set,
-            key,
-            value,
-            time_to_live=time_to_live,
-            if_not_exists=if_not_exists,
-        )
+    ) -> bool:
+        return self._inner.set(key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
 
-    def delete(self, key: str) -> Coroutine[Any, Any, bool]:
-        return postpone(self._inner.delete, key)
+    async def set_many(self, items: Iterable[tuple[str, WireT]]) -> None:
+        self._inner.set_many(items)
 
-    def clear(self) -> Coroutine[Any, Any, None]:
-        return postpone(self._inner.clear)
+    async def delete(self, key: str) -> bool:
+        return self._inner.delete(key)
+
+    async def clear(self) -> None:
+        self._inner.clear()
 
     @property
     def size(self) -> int:
         return self._inner.size
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        return self._inner.__exit__(exc_type, exc_value, traceback)
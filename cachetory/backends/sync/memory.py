@@ -1,35 +1,95 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from typing import Generic
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from time import time_ns
+from typing import Any, Generic, Iterable, Optional, Tuple
+from weakref import ReferenceType, ref
 
-from cachetory.interfaces.backends.private import WireT
+from cachetory.interfaces.backends.private import DefaultT, WireT
 from cachetory.interfaces.backends.sync import SyncBackend
-from cachetory.private.datetime import make_deadline
+from cachetory.private.datetime import ZERO_TIMEDELTA, datetime_to_ns, make_deadline_ns
+
+_Entry = Tuple[WireT, Optional[int]]
+"""
+Stored value and its expiration deadline in nanoseconds since the epoch, compared against `time.time_ns()`.
+
+Plain tuple saves the per-entry object header and attribute lookups, while keeping a single hash probe per access.
+"""
 
 
 class MemoryBackend(SyncBackend[WireT], Generic[WireT]):
     """Memory backend that stores everything in a local dictionary."""
 
-    __slots__ = ("_entries",)
+    __slots__ = ("_entries", "_scan_stopped", "_write_lock")
 
     @classmethod
     def from_url(cls, _url: str) -> MemoryBackend[WireT]:
         return MemoryBackend()
 
-    def __init__(self) -> None:
+    def __init__(self, *, expiration_scan_interval: timedelta | None = None) -> None:
+        """
+        Instantiate a memory backend.
+
+        Args:
+            expiration_scan_interval:
+                If specified, expired entries get periodically deleted by a background daemon thread.
+                Otherwise, they only get deleted when accessed.
+                The thread stops on exiting the context manager, or once the backend is garbage-collected.
+
+        Raises:
+            ValueError: the expiration scan interval is not positive.
+        """
+        if expiration_scan_interval is not None and expiration_scan_interval <= ZERO_TIMEDELTA:
+            raise ValueError("expiration scan interval must be positive")
         self._entries: dict[str, _Entry[WireT]] = {}
+        # Every write that may replace or remove an existing entry holds the lock, so that evictions can check
+        # that they delete the very entry they have seen expired. Reads, and inserting a missing key, are lock-free.
+        self._write_lock = Lock()
+        self._scan_stopped: Event | None = None
+        if expiration_scan_interval is not None:
+            self._scan_stopped = Event()
+            Thread(
+                target=_scan_expired,
+                args=(ref(self), expiration_scan_interval.total_seconds(), self._scan_stopped),
+                name="cachetory-memory-expiration-scan",
+                daemon=True,
+            ).start()
 
     def get(self, key: str) -> WireT:
-        return self._get_entry(key).value
+        # Hit path is inlined here, since it is the hottest one.
+        entry = self._entries[key]
+        value, deadline = entry
+        if deadline is not None and deadline <= time_ns():
+            self._evict(key, entry)
+            raise KeyError(key)
+        return value
+
+    def get_or_default(self, key: str, default: DefaultT) -> WireT | DefaultT:
+        if (entry := self._entries.get(key)) is None:
+            return default
+        value, deadline = entry
+        if deadline is not None and deadline <= time_ns():
+            self._evict(key, entry)
+            return default
+        return value
+
+    def get_many(self, *keys: str) -> Iterable[tuple[str, WireT]]:
+        now = time_ns()
+        get_entry = self._entries.get
+        for key in keys:
+            if (entry := get_entry(key)) is not None:
+                value, deadline = entry
+                if deadline is None or deadline > now:
+                    yield key, value
+                else:
+                    self._evict(key, entry)
+
+    def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._set_deadline(key, make_deadline_ns(time_to_live))
 
     def expire_at(self, key: str, deadline: datetime | None) -> None:
-        try:
-            entry = self._get_entry(key)
-        except KeyError:
-            pass
-        else:
-            entry.deadline = deadline
+        self._set_deadline(key, datetime_to_ns(deadline) if deadline is not None else None)
 
     def set(  # noqa: A003
         self,
@@ -39,42 +99,87 @@ class MemoryBackend(SyncBackend[WireT], Generic[WireT]):
         time_to_live: timedelta | None = None,
         if_not_exists: bool = False,
     ) -> bool:
-        entry = _Entry[WireT](value, make_deadline(time_to_live))
+        entry = (value, make_deadline_ns(time_to_live))
         if if_not_exists:
-            return self._entries.setdefault(key, entry) is entry
+            # `setdefault()` only inserts into a missing key, and the identity check tells whether it was our entry.
+            if (existing := self._entries.setdefault(key, entry)) is entry:
+                return True
+            if existing[1] is None or existing[1] > time_ns():
+                return False
+            # The existing entry has expired, so it does not count.
+            return self._replace_expired(key, existing, entry)
         else:
-            self._entries[key] = _Entry[WireT](value, make_deadline(time_to_live))
+            with self._write_lock:
+                self._entries[key] = entry
             return True
 
-    def delete(self, key: str) -> bool:
-        return self._entries.pop(key, _SENTINEL) is not _SENTINEL
+    def set_many(self, items: Iterable[tuple[str, WireT]]) -> None:
+        entries = [(key, (value, None)) for key, value in items]
+        with self._write_lock:
+            self._entries.update(entries)
+
+    def delete(self, key: str, *, _sentinel: Any = object()) -> bool:  # noqa: B008
+        # The sentinel is created once and bound as a keyword-only default, which makes it a local lookup
+        # rather than a global one, and keeps it from being passed positionally by accident.
+        with self._write_lock:
+            return self._entries.pop(key, _sentinel) is not _sentinel
 
     def clear(self) -> None:
-        self._entries.clear()
+        with self._write_lock:
+            self._entries.clear()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._scan_stopped is not None:
+            self._scan_stopped.set()
+
+    def _delete_expired(self) -> None:
+        """Delete all the expired entries."""
+        now = time_ns()
+        for key, entry in list(self._entries.items()):
+            if entry[1] is not None and entry[1] <= now:
+                self._evict(key, entry)
+
+    def _replace_expired(self, key: str, expired: _Entry[WireT], entry: _Entry[WireT]) -> bool:
+        """
+        Replace the expired entry, unless another writer has already changed it.
+
+        Writers which have seen the same expired entry are serialised by the lock, so that at most one of them succeeds.
+        """
+        with self._write_lock:
+            if self._entries.get(key) is expired:
+                self._entries[key] = entry
+                return True
+            return self._entries.setdefault(key, entry) is entry
 
-    def _get_entry(self, key: str) -> _Entry[WireT]:
-        entry = self._entries[key]
-        if entry.deadline is not None and entry.deadline <= datetime.now(timezone.utc):
-            self._entries.pop(key, None)  # might get popped by another thread
-            raise KeyError(f"`{key}` has expired")
-        return entry
+    def _set_deadline(self, key: str, deadline: int | None) -> None:
+        """Update the deadline of the entry, if it exists and has not expired yet."""
+        with self._write_lock:
+            if (entry := self._entries.get(key)) is None:
+                return
+            if entry[1] is not None and entry[1] <= time_ns():
+                del self._entries[key]
+            else:
+                self._entries[key] = (entry[0], deadline)
+
+    def _evict(self, key: str, entry: _Entry[WireT]) -> None:
+        """Delete the expired entry, unless it has been replaced or deleted in the meantime."""
+        with self._write_lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
 
     @property
     def size(self) -> int:
         return len(self._entries)
 
 
-class _Entry(Generic[WireT]):
-    """`mypy` doesn't support generic named tuples, thus defining this little one."""
-
-    value: WireT
-    deadline: datetime | None
-
-    __slots__ = ("value", "deadline")
-
-    def __init__(self, value: WireT, deadline: datetime | None) -> None:
-        self.value = value
-        self.deadline = deadline
-
+def _scan_expired(backend_ref: ReferenceType[MemoryBackend], interval: float, stopped: Event) -> None:
+    """
+    Periodically delete expired entries from the referenced backend.
 
-_SENTINEL = object()
+    Only a weak reference is held between the scans, so that the thread does not keep the backend alive.
+    """
+    while not stopped.wait(interval):
+        if (backend := backend_ref()) is None:
+            return
+        backend._delete_expired()
+        del backend
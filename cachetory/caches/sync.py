@@ -6,6 +6,9 @@ from cachetory.caches.private import DefaultT
 from cachetory.interfaces.backends.private import WireT
 from cachetory.interfaces.backends.sync import SyncBackend
 from cachetory.interfaces.serializers import Serializer, ValueT
+from cachetory.private.typing import NotSet
+
+_NOT_SET = NotSet()
 
 
 class Cache(AbstractContextManager, Generic[ValueT, WireT]):
@@ -51,10 +54,10 @@ class Cache(AbstractContextManager, Generic[ValueT, WireT]):
             >>> assert cache.get("key") == 42
             >>> assert cache.get("missing") is None
         """
-        try:
-            return self[key]
-        except KeyError:
+        data = self._backend.get_or_default(key, _NOT_SET)
+        if data is _NOT_SET:
             return default
+        return self._serializer.deserialize(data)  # type: ignore[arg-type]
 
     def get_many(self, *keys: str) -> Dict[str, ValueT]:
         """
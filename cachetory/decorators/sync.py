@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from contextlib import suppress
 from datetime import timedelta
 from functools import wraps
 from typing import Callable
@@ -12,10 +11,13 @@ from cachetory.decorators import shared
 from cachetory.interfaces.backends.private import WireT
 from cachetory.interfaces.serializers import ValueT, ValueT_co
 from cachetory.private.functools import into_callable
+from cachetory.private.typing import NotSet
 
 P = ParamSpec("P")
 """Original wrapped function parameter specification."""
 
+_MISS = NotSet()
+
 
 def cached(
     cache: Cache[ValueT, WireT] | Callable[..., Cache[ValueT, WireT] | None] | None,  # no way to use `P` here
@@ -45,24 +47,50 @@ def cached(
 
     def wrap(callable_: Callable[P, ValueT]) -> _CachedCallable[P, ValueT]:
         get_cache = into_callable(cache)
-        get_time_to_live = into_callable(time_to_live)
 
-        @wraps(callable_)
-        def cached_callable(*args: P.args, **kwargs: P.kwargs) -> ValueT:
-            cache_ = get_cache(callable_, *args, **kwargs)
+        # Resolve a constant time to live once, instead of wrapping it into a callable invoked on each miss.
+        get_time_to_live: Callable[..., timedelta | None] | None
+        if callable(time_to_live):
+            get_time_to_live, fixed_time_to_live = time_to_live, None
+        else:
+            get_time_to_live, fixed_time_to_live = None, time_to_live
+
+        def get_or_call(cache_: Cache[ValueT, WireT], /, *args: P.args, **kwargs: P.kwargs) -> ValueT:
+            """Look the value up in the specified cache, or call the wrapped callable and cache its result."""
             key_ = make_key(callable_, *args, **kwargs)
 
-            if cache_ is not None:
-                with suppress(KeyError):
-                    # `KeyError` normally means the value is «non-cached».
-                    return cache_[key_]
+            if (value := cache_.get(key_, _MISS)) is not _MISS:
+                return value  # type: ignore[return-value]
 
             value = callable_(*args, **kwargs)
-            if cache_ is not None and (exclude is None or not exclude(key_, value)):
-                time_to_live_ = get_time_to_live(key=key_)
+            if exclude is None or not exclude(key_, value):
+                time_to_live_ = fixed_time_to_live if get_time_to_live is None else get_time_to_live(key=key_)
                 cache_.set(key_, value, time_to_live=time_to_live_, if_not_exists=if_not_exists)
             return value
 
+        cached_callable: Callable[P, ValueT]
+        if callable(cache):
+
+            @wraps(callable_)
+            def cached_callable(*args: P.args, **kwargs: P.kwargs) -> ValueT:
+                if (cache_ := cache(callable_, *args, **kwargs)) is None:
+                    return callable_(*args, **kwargs)
+                return get_or_call(cache_, *args, **kwargs)
+
+        elif cache is not None:
+            # The cache instance is fixed, so resolve it once instead of on every call.
+            cache_ = cache
+
+            @wraps(callable_)
+            def cached_callable(*args: P.args, **kwargs: P.kwargs) -> ValueT:
+                return get_or_call(cache_, *args, **kwargs)
+
+        else:
+
+            @wraps(callable_)
+            def cached_callable(*args: P.args, **kwargs: P.kwargs) -> ValueT:
+                return callable_(*args, **kwargs)
+
         def purge(*args: P.args, **kwargs: P.kwargs) -> bool:
             if (cache := get_cache(callable_, *args, **kwargs)) is not None:
                 key = make_key(callable_, *args, **kwargs)
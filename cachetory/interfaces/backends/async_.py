@@ -9,12 +9,13 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import AsyncIterable, Generic, Iterable
 
 from typing_extensions import Never, Protocol
 
 from cachetory.interfaces.backends.private import WireT, WireT_co, WireT_contra
+from cachetory.private.datetime import make_deadline
 
 
 class AsyncBackendRead(Protocol[WireT_co]):
@@ -53,8 +54,7 @@ class AsyncBackendWrite(Protocol[WireT_contra]):
 
     async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
         """Set the expiration time on the key."""
-        deadline = datetime.now(timezone.utc) + time_to_live if time_to_live is not None else None
-        await self.expire_at(key, deadline)
+        await self.expire_at(key, make_deadline(time_to_live))
 
     async def expire_at(self, key: str, deadline: datetime | None) -> None:  # pragma: no cover
         """Set the expiration deadline on the key."""
@@ -29,3 +29,8 @@ Invariant backend value type – exact type which is stored at backend side.
 It is independent from a cached value type. Backend value is usually
 a serialized cached value.
 """
+
+DefaultT = TypeVar("DefaultT")
+"""
+Type of a default value returned by backend read operations when the key is missing.
+"""
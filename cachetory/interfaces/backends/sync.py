@@ -14,7 +14,7 @@ from typing import Generic, Iterable
 
 from typing_extensions import Protocol
 
-from cachetory.interfaces.backends.private import WireT, WireT_co, WireT_contra
+from cachetory.interfaces.backends.private import DefaultT, WireT, WireT_co, WireT_contra
 from cachetory.private.datetime import make_deadline
 
 
@@ -33,6 +33,18 @@ class SyncBackendRead(Protocol[WireT_co]):
         """
         raise NotImplementedError
 
+    def get_or_default(self, key: str, default: DefaultT) -> WireT_co | DefaultT:
+        """
+        Retrieve a value from the cache, or the default one if the key does not exist.
+
+        Returns:
+            Cached value, if it exists, or `default` otherwise.
+        """
+        try:
+            return self.get(key)
+        except KeyError:
+            return default
+
     def get_many(self, *keys: str) -> Iterable[tuple[str, WireT_co]]:
         """
         Get all the values corresponding to the specified keys.
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from time import time_ns
 
 ZERO_TIMEDELTA = timedelta()
+ONE_MICROSECOND = timedelta(microseconds=1)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 def make_deadline(time_to_live: timedelta | None = None) -> datetime | None:
@@ -13,3 +16,18 @@ def make_time_to_live(deadline: datetime | None = None) -> timedelta | None:
     if deadline is None:
         return None
     return max(deadline - datetime.now(timezone.utc), ZERO_TIMEDELTA)
+
+
+def timedelta_to_ns(value: timedelta) -> int:
+    """Convert the time delta into integer nanoseconds without going through `float`."""
+    return (value // ONE_MICROSECOND) * 1000
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert the timezone-aware datetime into integer nanoseconds since the epoch."""
+    return timedelta_to_ns(value - EPOCH)
+
+
+def make_deadline_ns(time_to_live: timedelta | None = None) -> int | None:
+    """Make the deadline in integer nanoseconds since the epoch, see also `make_deadline()`."""
+    return time_ns() + timedelta_to_ns(time_to_live) if time_to_live is not None else None
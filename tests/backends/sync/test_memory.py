@@ -1,8 +1,13 @@
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from threading import Barrier
+from time import sleep
 from typing import Iterable
 
 from freezegun import freeze_time
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 
 from cachetory.backends.sync.memory import MemoryBackend
 
@@ -23,6 +28,20 @@ def test_get_missing(backend: MemoryBackend[int]):
         backend.get("foo")
 
 
+def test_get_or_default(backend: MemoryBackend[int]):
+    backend.set("foo", 42)
+    assert backend.get_or_default("foo", None) == 42
+    assert backend.get_or_default("bar", None) is None
+
+
+def test_get_or_default_expired(backend: MemoryBackend[int]):
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+    with freeze_time("2022-06-11 21:33:01"):
+        assert backend.get_or_default("foo", None) is None
+    assert backend.size == 0
+
+
 def test_set_default(backend: MemoryBackend[int]):
     assert backend.set("foo", 42, if_not_exists=True)
     assert not backend.set("foo", 43, if_not_exists=True)
@@ -30,6 +49,54 @@ def test_set_default(backend: MemoryBackend[int]):
     assert backend.size == 1
 
 
+def test_set_default_expired(backend: MemoryBackend[int]):
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+    with freeze_time("2022-06-11 21:33:01"):
+        assert backend.set("foo", 43, if_not_exists=True)
+        assert not backend.set("foo", 44, if_not_exists=True)
+        assert backend.get("foo") == 43
+
+
+def test_evict_replaced(backend: MemoryBackend[int]):
+    """Eviction of an entry, which has been replaced in the meantime, keeps the new entry."""
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+    expired = backend._entries["foo"]
+    backend.set("foo", 43)
+    backend._evict("foo", expired)
+    assert backend.get("foo") == 43
+
+
+def test_set_default_expired_concurrently(backend: MemoryBackend[int]):
+    """Of the concurrent writers, which all see the same expired entry, exactly one succeeds."""
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+
+    n_writers = 8
+    barrier = Barrier(n_writers)
+
+    def set_default(value: int) -> bool:
+        barrier.wait()
+        return backend.set("foo", value, if_not_exists=True)
+
+    with freeze_time("2022-06-11 21:33:01"), ThreadPoolExecutor(n_writers) as executor:
+        results = list(executor.map(set_default, range(n_writers)))
+
+    assert results.count(True) == 1
+    assert backend.get("foo") == results.index(True)
+
+
+def test_replace_expired_already_replaced(backend: MemoryBackend[int]):
+    """Replacing the expired entry, which has already been replaced, is refused."""
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+    expired = backend._entries["foo"]
+    assert backend._replace_expired("foo", expired, (43, None))
+    assert not backend._replace_expired("foo", expired, (44, None))
+    assert backend.get("foo") == 43
+
+
 def test_delete_existing(backend: MemoryBackend[int]):
     backend.set("foo", 42)
     assert backend.delete("foo")
@@ -47,6 +114,15 @@ def test_set_get_many(backend: MemoryBackend[int]):
     assert list(backend.get_many("foo", "bar")) == [("foo", 42), ("bar", 100500)]
 
 
+def test_get_many_expired(backend: MemoryBackend[int]):
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+        backend.set("bar", 43)
+    with freeze_time("2022-06-11 21:33:01"):
+        assert list(backend.get_many("foo", "bar", "qux")) == [("bar", 43)]
+    assert backend.size == 1
+
+
 def test_set_with_ttl(backend: MemoryBackend[int]):
     with freeze_time("2022-06-11 21:33:00"):
         backend.set("foo", 42, time_to_live=timedelta(seconds=59))
@@ -81,3 +157,42 @@ def test_clear(backend: MemoryBackend[int]):
     backend.set("foo", 42)
     backend.clear()
     assert backend.size == 0
+
+
+def test_delete_expired(backend: MemoryBackend[int]):
+    with freeze_time("2022-06-11 21:33:00"):
+        backend.set("foo", 42, time_to_live=timedelta(seconds=1))
+        backend.set("bar", 43, time_to_live=timedelta(seconds=2))
+        backend.set("qux", 44)
+    with freeze_time("2022-06-11 21:33:01"):
+        backend._delete_expired()
+    assert backend.size == 2
+
+
+def test_expiration_scan():
+    with MemoryBackend[int](expiration_scan_interval=timedelta(milliseconds=10)) as backend:
+        backend.set("foo", 42, time_to_live=timedelta(milliseconds=1))
+        for _ in range(100):
+            if backend.size == 0:
+                break
+            sleep(0.01)
+        assert backend.size == 0
+    assert backend._scan_stopped is not None
+    assert backend._scan_stopped.is_set()
+
+
+@mark.parametrize("interval", [timedelta(), timedelta(seconds=-1)])
+def test_expiration_scan_interval_not_positive(interval: timedelta):
+    with raises(ValueError):
+        MemoryBackend[int](expiration_scan_interval=interval)
+
+
+def test_expiration_scan_stops_when_backend_collected():
+    threads_before = set(threading.enumerate())
+    backend = MemoryBackend[int](expiration_scan_interval=timedelta(milliseconds=10))
+    (scan_thread,) = set(threading.enumerate()) - threads_before
+
+    del backend
+    gc.collect()
+    scan_thread.join(timeout=1.0)
+    assert not scan_thread.is_alive()
@@ -1,8 +1,17 @@
 from pytest import raises
 
-from cachetory.backends.sync import from_url
+from cachetory.backends.sync import MemoryBackend, from_url
 
 
 def test_from_url_unknown_scheme():
     with raises(ValueError):
         from_url("invalid://")
+
+
+def test_from_url_missing_scheme():
+    with raises(ValueError):
+        from_url("memory")
+
+
+def test_from_url_scheme_case_insensitive():
+    assert isinstance(from_url("MEMORY://"), MemoryBackend)
@@ -34,6 +34,24 @@ def test_simple(cache: Cache[int, int]) -> None:
     assert call_counter == 1, "cache did not work"
 
 
+def test_method(cache: Cache[int, int]) -> None:
+    call_counter = 0
+
+    class Calculator:
+        @cached(cache)
+        def expensive_method(self, arg: int) -> int:
+            nonlocal call_counter
+            call_counter += 1
+            return arg * 2
+
+    # `_CachedCallable` does not describe method binding, hence the ignores.
+    calculator = Calculator()
+    assert calculator.expensive_method(21) == 42, "the value is not forwarded"  # type: ignore[call-arg, arg-type]
+    assert call_counter == 1
+    assert calculator.expensive_method(21) == 42, "the cached value is not returned"  # type: ignore[call-arg, arg-type]
+    assert call_counter == 1, "cache did not work"
+
+
 def test_time_to_live_callable_depending_on_key(cache: Cache[int, int]) -> None:
     """time_to_live accepts the key as a keyword argument, allowing for different expirations."""
 
@@ -91,3 +109,31 @@ def test_none_cache() -> None:
         return 42
 
     expensive_function()
+
+
+def test_fixed_none_cache() -> None:
+    cache: Cache[int, int] | None = None
+
+    @cached(cache)
+    def expensive_function() -> int:
+        return 42
+
+    assert expensive_function() == 42
+
+
+def test_cache_callable(cache: Cache[int, int]) -> None:
+    @cached(lambda *_, **__: cache, make_key=lambda _, x: str(x))
+    def expensive_function(x: int) -> int:
+        return x * x
+
+    assert expensive_function(2) == 4
+    assert cache.get("2") == 4
+
+
+def test_kwarg_named_like_internal_parameter(cache: Cache[int, int]) -> None:
+    @cached(cache)
+    def expensive_function(*, cache_: int) -> int:
+        return cache_
+
+    assert expensive_function(cache_=42) == 42
+    assert expensive_function(cache_=42) == 42
@@ -1,6 +1,14 @@
 from datetime import datetime, timedelta, timezone
 
-from cachetory.private.datetime import ZERO_TIMEDELTA, make_time_to_live
+from freezegun import freeze_time
+
+from cachetory.private.datetime import (
+    ZERO_TIMEDELTA,
+    datetime_to_ns,
+    make_deadline_ns,
+    make_time_to_live,
+    timedelta_to_ns,
+)
 
 
 def test_make_time_to_live_none() -> None:
@@ -15,3 +23,22 @@ def test_make_time_to_live_positive() -> None:
     time_to_live = make_time_to_live(datetime.now(timezone.utc) + timedelta(seconds=10.0))
     assert time_to_live is not None
     assert time_to_live > ZERO_TIMEDELTA
+
+
+def test_timedelta_to_ns() -> None:
+    assert timedelta_to_ns(timedelta(seconds=1, microseconds=1)) == 1_000_001_000
+
+
+def test_datetime_to_ns() -> None:
+    assert datetime_to_ns(datetime(1970, 1, 1, 0, 0, 1, 1, tzinfo=timezone.utc)) == 1_000_001_000
+
+
+def test_make_deadline_ns_none() -> None:
+    assert make_deadline_ns(None) is None
+
+
+def test_make_deadline_ns() -> None:
+    with freeze_time("2022-06-11 21:33:00"):
+        assert make_deadline_ns(timedelta(seconds=1)) == datetime_to_ns(
+            datetime(2022, 6, 11, 21, 33, 1, tzinfo=timezone.utc),
+        )